@@ -0,0 +1,633 @@
+import io
+import json
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+from datetime import date, timedelta
+from numba import njit
+
+# ------------------- Lazy yfinance import -------------------
+# yfinance drags in requests and a tree of submodules at import time, but
+# most Streamlit reruns (dropdown changes, date picks) never touch the
+# network — and with the disk caches warm, neither does an analysis run.
+# Defer the import until a call site actually needs it.
+@st.cache_resource
+def get_yfinance():
+    import yfinance
+    return yfinance
+
+@st.cache_resource
+def get_pyplot():
+    """Import matplotlib lazily and apply the style exactly once.
+
+    Only the analysis charts need matplotlib; deferring the import keeps
+    it off the cold-start path and off every rerun that never analyzes.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    # Match seaborn's "whitegrid" look without importing seaborn, which
+    # pulls in scipy and a large theming module just to set a style.
+    plt.rcParams.update({
+        "axes.grid": True,
+        "grid.color": "0.85",
+        "axes.facecolor": "white",
+        "axes.edgecolor": "0.8",
+        "axes.axisbelow": True,
+    })
+    return plt
+
+# ------------------- Numba rolling kernels -------------------
+# Single-pass replacements for pandas .rolling(): min/max keep a monotonic
+# deque of indices, so each is O(n) instead of O(n * window).
+
+@njit(cache=True, nogil=True)
+def compute_indicators(close, period=14):
+    """Compute SMA_50, SMA_200, daily returns and Wilder RSI in one pass.
+
+    Fusing the four loops streams the Close array through L1 once instead
+    of four times. The SMAs use incremental running sums; the RSI seeds
+    its averages with the SMA of the first `period` gains/losses and then
+    applies the RMA recursion avg = (avg * (period - 1) + x) / period,
+    matching ta.RSIIndicator (NaN for the first `period` positions).
+    """
+    n = close.shape[0]
+    sma50 = np.full(n, np.nan)
+    sma200 = np.full(n, np.nan)
+    ret = np.full(n, np.nan)
+    rsi = np.full(n, np.nan)
+    sum50 = 0.0
+    sum200 = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(n):
+        sum50 += close[i]
+        sum200 += close[i]
+        if i >= 50:
+            sum50 -= close[i - 50]
+        if i >= 200:
+            sum200 -= close[i - 200]
+        if i >= 49:
+            sma50[i] = sum50 / 50
+        if i >= 199:
+            sma200[i] = sum200 / 200
+        if i > 0:
+            delta = close[i] - close[i - 1]
+            ret[i] = delta / close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            if i <= period:
+                avg_gain += gain
+                avg_loss += loss
+                if i == period:
+                    avg_gain /= period
+                    avg_loss /= period
+                    rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss > 0 else 100.0
+            else:
+                avg_gain = (avg_gain * (period - 1) + gain) / period
+                avg_loss = (avg_loss * (period - 1) + loss) / period
+                rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss > 0 else 100.0
+    return sma50, sma200, ret, rsi
+
+@njit(cache=True, nogil=True)
+def rolling_min(values, window):
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        while tail > head and values[deque[tail - 1]] >= values[i]:
+            tail -= 1
+        deque[tail] = i
+        tail += 1
+        if deque[head] <= i - window:
+            head += 1
+        if i >= window - 1:
+            out[i] = values[deque[head]]
+    return out
+
+@njit(cache=True, nogil=True)
+def rolling_max(values, window):
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        while tail > head and values[deque[tail - 1]] <= values[i]:
+            tail -= 1
+        deque[tail] = i
+        tail += 1
+        if deque[head] <= i - window:
+            head += 1
+        if i >= window - 1:
+            out[i] = values[deque[head]]
+    return out
+
+# ------------------- Tickers -------------------
+TICKERS = {
+    "Stocks": (
+        "AAPL", "MSFT", "AMZN", "GOOGL", "META", "TSLA", "NVDA", "AMD", "NFLX",
+        "JPM", "BAC", "V", "MA", "WMT", "KO", "PEP", "DIS", "HD", "PG", "JNJ", "UNH",
+        "PFE", "MRK", "LLY", "ABBV", "CVX", "XOM", "BP", "TMUS", "VZ", "T", "ORCL",
+        "IBM", "INTC", "CSCO", "ADBE", "CRM", "PYPL", "QCOM", "TXN", "SQ", "SHOP",
+        "TWLO", "ZM", "DOCU", "ROKU", "UBER", "LYFT", "SNAP", "PTON", "PLTR", "CRWD",
+        "OKTA", "ZS", "DDOG", "MDB", "NET", "EA", "ATVI", "DKNG", "RBLX", "BYND",
+        "TGT", "COST", "LOW", "NKE", "SBUX", "MCD", "YUM", "LULU"
+    ),
+    "ETFs": (
+        "SPY", "QQQ", "VOO", "IWM", "DIA", "XLK", "XLE", "XLF", "XLY", "XLP",
+        "XLV", "XLC", "XLI", "XLB", "XLRE", "ARKK", "ARKG", "ARKQ", "ARKW",
+        "ARKF", "TLT", "HYG", "LQD", "EEM", "EFA", "VNQ", "GLD", "SLV", "USO", "UNG"
+    ),
+    "Crypto": ("BTC-USD", "ETH-USD", "SOL-USD", "XRP-USD", "ADA-USD", "DOGE-USD",
+               "BNB-USD", "AVAX-USD", "DOT-USD", "MATIC-USD"),
+    "Forex": ("EURUSD=X", "GBPUSD=X", "USDJPY=X", "AUDUSD=X",
+              "NZDUSD=X", "USDCAD=X", "USDCHF=X", "EURGBP=X", "EURJPY=X"),
+    "Commodities": ("GC=F", "SI=F", "CL=F", "NG=F", "HG=F", "ZC=F", "ZW=F", "ZS=F",
+                    "KC=F", "SB=F", "LE=F", "HE=F"),
+    "Indices": ("^GSPC", "^DJI", "^IXIC", "^RUT", "^FTSE", "^N225", "^HSI")
+}
+CATEGORIES = tuple(TICKERS)
+
+# ------------------- Earliest available date (disk-cached) -------------------
+CACHE_DIR = ".cache"
+EARLIEST_DATES_FILE = os.path.join(CACHE_DIR, "earliest_dates.json")
+
+@st.cache_resource
+def load_earliest_dates():
+    if os.path.exists(EARLIEST_DATES_FILE):
+        with open(EARLIEST_DATES_FILE) as f:
+            return json.load(f)
+    return {}
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_earliest_date(symbol):
+    """Return the earliest trading date for symbol, probing yfinance only once.
+
+    The result is kept in a JSON file under .cache/ so reruns (and restarts)
+    avoid re-downloading the full history just to read index.min(). The probe
+    uses a coarse 3-month interval, which returns a few kB instead of MBs.
+    """
+    store = load_earliest_dates()
+    if symbol in store:
+        return pd.to_datetime(store[symbol]).date()
+
+    history = get_yfinance().Ticker(symbol).history(period="max", interval="3mo")
+    if history.empty:
+        return None
+
+    earliest = pd.to_datetime(history.index.min()).date()
+    store[symbol] = earliest.isoformat()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(EARLIEST_DATES_FILE, "w") as f:
+        json.dump(store, f)
+    return earliest
+
+# ------------------- Cached downloader -------------------
+def normalize_ohlcv(frame):
+    """Apply the dtype layout shared by both parquet cache writers.
+
+    float64 is overkill for daily prices, and the rolling kernels are
+    memory-bound, so float32 halves the bytes moved per pass (and the
+    parquet on disk). Volume becomes int64, not int32: crypto dollar
+    volumes routinely exceed 2**31.
+    """
+    frame = frame.dropna(subset=["Close"])
+    for col in ("Open", "High", "Low", "Close", "Adj Close"):
+        if col in frame.columns:
+            frame[col] = frame[col].astype("float32")
+    if "Volume" in frame.columns:
+        frame["Volume"] = frame["Volume"].fillna(0).astype("int64")
+    return frame
+
+# Two cache layers: st.cache_data (in-memory, per-process) on top of a
+# parquet file under .cache/, so server restarts and other workers reuse
+# downloads instead of hitting the network again.
+@st.cache_data(ttl=900, show_spinner=False)
+def get_data(symbol, start, end):
+    path = os.path.join(CACHE_DIR, f"{symbol}_{start}_{end}.parquet")
+    if os.path.exists(path):
+        return pd.read_parquet(path)
+    data = get_yfinance().download(
+        symbol,
+        start=start,
+        end=end,
+        progress=False,
+        threads=False,
+        multi_level_index=False,
+        auto_adjust=True,
+    )
+    data = normalize_ohlcv(data)
+    # An empty result (blocked network, rate limit, delisted symbol) must
+    # not be written to disk, or it would poison the cache for this key.
+    if not data.empty:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        data.to_parquet(path)
+    return data
+
+# ------------------- Background category prefetch -------------------
+def prefetch_category(symbols, start, end):
+    """Warm the parquet cache for every symbol in a category.
+
+    Runs in a daemon thread on category change: one batched, threaded
+    yfinance download, split per symbol into the same cache files that
+    get_data reads, so switching symbols within a category hits disk.
+    Best-effort only — the foreground path downloads on demand anyway.
+    """
+    try:
+        batch = get_yfinance().download(
+            list(symbols),
+            start=start,
+            end=end,
+            group_by="ticker",
+            threads=True,
+            progress=False,
+            auto_adjust=True,
+        )
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        for sym in symbols:
+            if sym not in batch.columns.get_level_values(0):
+                continue
+            path = os.path.join(CACHE_DIR, f"{sym}_{start}_{end}.parquet")
+            if os.path.exists(path):
+                continue
+            frame = normalize_ohlcv(batch[sym])
+            if frame.empty:
+                continue
+            frame.to_parquet(path)
+    except Exception:
+        pass
+
+# ------------------- Cached indicator calculator -------------------
+def get_indicators(data):
+    close = data["Close"].to_numpy()
+    sma50, sma200, ret, rsi = compute_indicators(close)
+    data["SMA_50"] = sma50
+    data["SMA_200"] = sma200
+    data["Daily Return"] = ret
+    data["RSI"] = rsi
+    return data
+
+# Keyed by (symbol, start, end) scalars rather than the input DataFrame:
+# st.cache_data would otherwise re-hash the whole frame on every call just
+# to look up the cache entry. Warm hits are a single parquet read.
+@st.cache_data(ttl=3600)
+def get_indicators_cached(symbol, start, end):
+    path = os.path.join(CACHE_DIR, f"ind_{symbol}_{start}_{end}.parquet")
+    if os.path.exists(path):
+        return pd.read_parquet(path)
+    data = get_indicators(get_data(symbol, start, end))
+    if not data.empty:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        data.to_parquet(path)
+    return data
+
+# ------------------- Cached fundamentals fetcher -------------------
+@st.cache_data(ttl=3600)
+def get_fundamentals(symbol):
+    return get_yfinance().Ticker(symbol).info
+
+# ------------------- Cached price figure -------------------
+# One Figure per server process, reused across reruns: allocating a fresh
+# Agg canvas (and warming the font cache) on every rerun is a known
+# matplotlib hot path. Each render just clears the axes and redraws.
+# cache_resource objects are shared across sessions and matplotlib is not
+# thread-safe, so each figure carries a lock that renderers must hold for
+# the whole clear-draw-savefig sequence.
+@st.cache_resource
+def get_price_fig():
+    fig, ax = get_pyplot().subplots(figsize=(12, 6))
+    return fig, ax, threading.Lock()
+
+@st.cache_resource
+def get_candle_fig():
+    fig, ax = get_pyplot().subplots(figsize=(12, 6))
+    return fig, ax, threading.Lock()
+
+# How many trading days the candlestick panel shows
+CANDLE_DAYS = 180
+
+def draw_candles(ax, window):
+    """Draw a candlestick panel as two batched collections.
+
+    All bodies go into a single PatchCollection and all wicks into a single
+    LineCollection, so matplotlib issues one draw call per collection
+    instead of four artists per bar — this stays fast even for intraday
+    bar counts.
+    """
+    from matplotlib.collections import LineCollection, PatchCollection
+    from matplotlib.patches import Rectangle
+
+    opens = window["Open"].to_numpy()
+    highs = window["High"].to_numpy()
+    lows = window["Low"].to_numpy()
+    closes = window["Close"].to_numpy()
+    x = np.arange(len(window))
+    colors = np.where(closes >= opens, "green", "red")
+
+    bodies = [
+        Rectangle((x[i] - 0.4, min(opens[i], closes[i])), 0.8, abs(closes[i] - opens[i]))
+        for i in range(len(x))
+    ]
+    ax.add_collection(PatchCollection(bodies, facecolors=colors, edgecolors=colors, linewidths=0.5))
+    wicks = np.stack([np.column_stack([x, lows]), np.column_stack([x, highs])], axis=1)
+    ax.add_collection(LineCollection(wicks, colors=colors, linewidths=0.8))
+
+    ax.set_xlim(-1, len(x))
+    ax.set_ylim(lows.min() * 0.995, highs.max() * 1.005)
+    ticks = np.linspace(0, len(x) - 1, min(6, len(x))).astype(np.int64)
+    ax.set_xticks(ticks)
+    ax.set_xticklabels([d.strftime("%Y-%m-%d") for d in window.index[ticks]])
+
+@st.fragment
+def render_candles(full_data):
+    """Candlestick panel in its own fragment.
+
+    Moving the lookback slider reruns only this function — not the whole
+    script — so the download/indicator pipeline and the other charts are
+    untouched by slider interactions.
+    """
+    st.subheader("🕯️ Candlestick Chart")
+    days = st.slider("Lookback (trading days)", min_value=30, max_value=365, value=CANDLE_DAYS, step=5)
+    candles = full_data.iloc[-days:]
+    fig, ax, lock = get_candle_fig()
+    with lock:
+        ax.clear()
+        draw_candles(ax, candles)
+        # Overlay the SMAs already computed on the full series: recomputing
+        # them on the sliced window would both duplicate work and give wrong
+        # values at the left edge, where the window lacks the preceding
+        # 50/200 days.
+        candle_x = np.arange(len(candles))
+        ax.plot(candle_x, candles["SMA_50"].to_numpy(), color="orange", linewidth=1, label="SMA 50")
+        ax.plot(candle_x, candles["SMA_200"].to_numpy(), color="purple", linewidth=1, label="SMA 200")
+        ax.legend(loc="upper left")
+        png = fig_to_png(fig)
+    st.image(png)
+
+# 12 in x 90 dpi — more plotted points than this cannot be distinguished
+CANVAS_WIDTH_PX = 1080
+
+# Annualization factor for daily-return volatility
+SQRT_252 = math.sqrt(252.0)
+
+# Lower bound for the date pickers
+MIN_DATE = date(1900, 1, 1)
+
+def fig_to_png(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=90)
+    return buf.getvalue()
+
+def downsample_envelope(index, values, width_px=CANVAS_WIDTH_PX):
+    """Reduce a long series to its min/max envelope per pixel column.
+
+    A solid line can only show one vertical span per pixel of width, so
+    keeping the per-bucket extremes renders identically while capping the
+    plotted points at ~2 * width_px regardless of the date range.
+    """
+    n = len(values)
+    if n <= 2 * width_px:
+        return index, values
+    step = n // width_px
+    m = (n // step) * step
+    segments = values[:m].reshape(-1, step)
+    base = np.arange(0, m, step)
+    lows = base + np.argmin(segments, axis=1)
+    highs = base + np.argmax(segments, axis=1)
+    keep = np.sort(np.concatenate([lows, highs, np.arange(m, n)]))
+    return index[keep], values[keep]
+
+def render():
+    """Build the dashboard UI; the entry-point script calls this each rerun."""
+    # Streamlit page config
+    st.set_page_config(page_title="Financial Analytics Dashboard", layout="wide")
+    st.title("📈 Financial Market Analytics Dashboard")
+    st.write("Analyze stocks, crypto, forex, commodities, and ETFs.")
+
+    # ------------------- Session State -------------------
+    if "analyzed" not in st.session_state:
+        st.session_state.analyzed = False
+
+    # ------------------- UI -------------------
+    col1, col2 = st.columns(2)
+    with col1:
+        category = st.selectbox("Select Asset Category:", CATEGORIES)
+    with col2:
+        symbol = st.selectbox(f"Select {category.capitalize()} Symbol:", TICKERS[category])
+
+    # ------------------- Date selection -------------------
+    # Maximum allowed range in days (10 years)
+    max_range_days = 365 * 10
+
+    # date.today() is a plain stdlib call; pd.to_datetime("today") routes a
+    # string through pandas' timestamp parser on every rerun.
+    today = date.today()
+
+    col1, col2 = st.columns(2)
+    with col1:
+        user_start_date = st.date_input(
+            "Start Date",
+            value=today - timedelta(days=max_range_days),
+            min_value=MIN_DATE,
+            max_value=today
+        )
+    with col2:
+        end_date = st.date_input(
+            "End Date",
+            value=today,
+            min_value=MIN_DATE,
+            max_value=today
+        )
+    if user_start_date >= end_date:
+        st.error("❌ Start date must be earlier than the end date.")
+        st.stop()
+
+    allowed_start_date = end_date - timedelta(days = max_range_days)
+
+    # The earliest-date probe only matters when the requested start falls
+    # outside the 10-year window — in the common case of a recent range the
+    # (potentially network-bound) lookup is skipped entirely.
+    if user_start_date < allowed_start_date:
+        earliest_date = get_earliest_date(symbol)
+        if earliest_date is None:
+            st.error("❌ No data retrieved — YFinance may be blocked or the symbol is invalid.")
+            st.stop()
+        # Final start date considering earliest available date and 10-year limit
+        start_date = max(user_start_date, earliest_date, allowed_start_date)
+    else:
+        start_date = user_start_date
+
+    # Adjust start_date if the range exceeds 10 years
+    if start_date > user_start_date:
+        st.warning(
+            f"⚠️ Date range limited to 10 years for performance. Start date adjusted to {start_date}."
+        )
+
+    # Inform the user of the selected date range (adjusted or not)
+    st.info(f"Selected date range: {start_date} to {end_date}")
+
+    # Prefetch the rest of the category once per (category, range) so that
+    # switching symbols within the category is served from the warm cache.
+    prefetch_key = (category, start_date, end_date)
+    if st.session_state.get("prefetched") != prefetch_key:
+        st.session_state.prefetched = prefetch_key
+        threading.Thread(
+            target=prefetch_category,
+            args=(TICKERS[category], start_date, end_date),
+            daemon=True,
+        ).start()
+
+    # ---------------- Analyze Button ----------------
+    if st.button("🔍 Analyze"):
+        st.session_state.analyzed = True
+
+    # ---------------- Analysis ----------------
+    if st.session_state.analyzed:
+        # Only refetch when the inputs actually changed: reruns triggered by
+        # unrelated widget events reuse the exact same DataFrame object from
+        # session state, skipping even st.cache_data's key-hashing step.
+        analysis_key = (symbol, start_date, end_date)
+        if st.session_state.get("analysis_key") != analysis_key:
+            # Fire the independent network calls concurrently; yfinance releases
+            # the GIL during HTTP I/O, so latency drops from sum(t_i) to max(t_i).
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                data_future = executor.submit(get_indicators_cached, symbol, start_date, end_date)
+                fundamentals_future = (
+                    executor.submit(get_fundamentals, symbol) if category == "Stocks" else None
+                )
+                full_data = data_future.result()
+                # A failed fundamentals fetch (Yahoo 429s this endpoint
+                # routinely) must not kill the whole analysis — degrade to
+                # the warning in the fundamentals section, as the baseline
+                # did when the fetch lived inside its try/except.
+                fundamentals = None
+                fundamentals_error = None
+                if fundamentals_future is not None:
+                    try:
+                        fundamentals = fundamentals_future.result()
+                    except Exception as e:
+                        fundamentals_error = e
+            # Bail out before recording the key, so a transient failure is
+            # retried on the next rerun instead of sticking for the session.
+            if full_data.empty:
+                st.error("❌ No data retrieved — YFinance may be blocked or the symbol is invalid.")
+                st.stop()
+            st.session_state.full_data = full_data
+            st.session_state.fundamentals = fundamentals
+            st.session_state.fundamentals_error = fundamentals_error
+            st.session_state.analysis_key = analysis_key
+        full_data = st.session_state.full_data
+    
+        # ------------------- Close Price -------------------
+        st.subheader(f"📌 {symbol} Closing Price")
+        fig, ax, lock = get_price_fig()
+        with lock:
+            ax.clear()
+            x, y = downsample_envelope(full_data.index, full_data["Close"].to_numpy())
+            ax.plot(x, y, linewidth=1)
+            ax.set_ylabel("Close")
+            png = fig_to_png(fig)
+        st.image(png)
+
+        # ------------------- Support & Resistance Table -------------------
+        windows = [20, 50, 100]
+        support_levels = {}
+        resistance_levels = {}
+
+        low = full_data["Low"].to_numpy()
+        high = full_data["High"].to_numpy()
+        for w in windows:
+            support_levels[f"Support_{w}d"] = rolling_min(low, w)[-1]
+            resistance_levels[f"Resistance_{w}d"] = rolling_max(high, w)[-1]
+
+        # Create a DataFrame for display
+        sr_df = pd.DataFrame([support_levels, resistance_levels], index=["Support", "Resistance"])
+        st.table(sr_df)
+    
+        # ---------------- Moving Averages ----------------
+        st.subheader("📊 Moving Averages (50 & 200 Days)")
+        st.line_chart(full_data[["Close", "SMA_50", "SMA_200"]])
+
+        # ---------------- Candlestick ----------------
+        render_candles(full_data)
+
+        # ---------------- SMA-based Buy/Sell Signal ----------------
+        # Read the scalars off the underlying arrays (zero-copy) instead of
+        # going through Series.__getitem__/iloc dispatch per lookup.
+        last50 = full_data["SMA_50"].to_numpy()[-1]
+        last200 = full_data["SMA_200"].to_numpy()[-1]
+
+        if not (math.isnan(last50) or math.isnan(last200)):
+            if last50 > last200:
+                st.success("✅ Potential Buy Signal: SMA 50 is above SMA 200")
+            elif last50 < last200:
+                st.warning("⚠️ Potential Sell Signal: SMA 50 is below SMA 200")
+        else:
+            st.info("ℹ️ Not enough data to generate SMA signals")
+
+        # ---------------- Volatility ----------------
+        # np.nanstd on the raw array skips pandas' reduction dispatch; ddof=1
+        # matches the sample std that Series.std used.
+        returns = full_data["Daily Return"].to_numpy()
+        volatility = float(np.nanstd(returns, ddof=1)) * SQRT_252
+        st.subheader("📌 Annual Volatility")
+        st.write(f"**{volatility:.2%}**")
+
+        # ---------------- Return Distribution ----------------
+        # Binning server-side with np.histogram and shipping 50 bars is far
+        # cheaper than rasterizing a matplotlib histogram per rerun.
+        st.subheader("📊 Daily Return Distribution")
+        counts, edges = np.histogram(returns[~np.isnan(returns)], bins=50)
+        centers = np.round((edges[:-1] + edges[1:]) / 2, 5)
+        st.bar_chart(pd.Series(counts, index=centers))
+
+        # ---------------- RSI ----------------
+        st.subheader("🔁 Relative Strength Index (RSI)")
+        rsi_clean = full_data["RSI"].dropna()
+        st.line_chart(rsi_clean)
+
+        last_rsi = full_data["RSI"].to_numpy()[-1]
+        if not math.isnan(last_rsi):
+            if last_rsi > 70:
+                st.warning("⚠️ RSI indicates overbought — potential caution for buying")
+            elif last_rsi < 30:
+                st.success("✅ RSI indicates oversold — potential buying opportunity")
+            else:
+                st.info("ℹ️ RSI in neutral range — no immediate signal")
+
+        if category == "Stocks":
+            st.subheader(f"📊 {symbol} Fundamentals")
+            ticker_info = st.session_state.fundamentals
+            if ticker_info is None:
+                st.warning(f"⚠️ Unable to fetch fundamentals: {st.session_state.fundamentals_error}")
+            else:
+                try:
+                    market_cap = ticker_info.get("marketCap", "N/A")
+                    pe_ratio = ticker_info.get("trailingPE", "N/A")
+                    pb_ratio = ticker_info.get("priceToBook", "N/A")
+                    eps = ticker_info.get("trailingEps", "N/A")
+                    dividend_yield = ticker_info.get("dividendYield", "N/A")
+
+                    # Display metrics safely
+                    st.write(f"**Market Cap:** {market_cap:,}" if pd.notna(market_cap) else "**Market Cap:** N/A")
+                    st.write(f"**P/E Ratio:** {pe_ratio}" if pd.notna(pe_ratio) else "**P/E Ratio:** N/A")
+                    st.write(f"**P/B Ratio:** {pb_ratio}" if pd.notna(pb_ratio) else "**P/B Ratio:** N/A")
+                    st.write(f"**EPS:** {eps}" if pd.notna(eps) else "**EPS:** N/A")
+                    st.write(f"**Dividend Yield:** {dividend_yield:.2%}" if pd.notna(dividend_yield) else "**Dividend Yield:** N/A")
+                except Exception as e:
+                    st.warning(f"⚠️ Unable to fetch fundamentals: {e}")
+        else:
+            st.info("ℹ️ Fundamental metrics are only available for stocks.")
+
+    
+        # --- Show analysis complete at the very bottom ---
+        st.success("✅ Analysis complete!")